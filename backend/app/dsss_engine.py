@@ -1,36 +1,103 @@
 """DSP helpers backing the DSSS simulator endpoints."""
 from __future__ import annotations
 
+import functools
 import hashlib
 import math
 import uuid
 from collections import OrderedDict
-from dataclasses import dataclass
-from typing import Dict, MutableMapping, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, MutableMapping, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
 
 from .schemas import CodingScheme, StageName
 
+try:  # scipy's pocketfft build can spread a transform across cores
+    from scipy import fft as _fft
 
-FloatArray = NDArray[np.float64]
+    _FFT_KWARGS: Dict[str, int] = {"workers": -1}
+except ImportError:  # pragma: no cover - optional dependency
+    _fft = np.fft
+    _FFT_KWARGS = {}
+
+try:  # numba fuses the byte-wise line-coding loops into single kernels
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+FloatArray = NDArray[np.float32]
+
+# A Hamming-windowed FIR's transition band is ~3.3 * sample_rate / numtaps wide; this many taps
+# per sample_rate / bandwidth keeps it within a quarter of the noise bandwidth.
+NOISE_FIR_TAPS_PER_RATIO = 14
+MAX_NOISE_FIR_TAPS = 257
+PIPELINE_TILE_SAMPLES = 16384
 
 
-@dataclass
 class StageSnapshot:
-    waveform: FloatArray
-    sample_rate: float
+    """Stage tap; ``waveform`` is ``base`` with each sample held for ``repeat_factor`` samples."""
+
+    __slots__ = ("base", "sample_rate", "repeat_factor", "_freqs", "_mags")
+
+    def __init__(self, base: FloatArray, sample_rate: float, repeat_factor: int = 1) -> None:
+        self.base = base
+        self.sample_rate = sample_rate
+        self.repeat_factor = repeat_factor
+        self._freqs: Optional[FloatArray] = None
+        self._mags: Optional[FloatArray] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"StageSnapshot(samples={self.base.size * self.repeat_factor}, "
+            f"sample_rate={self.sample_rate}, repeat_factor={self.repeat_factor})"
+        )
+
+    @property
+    def waveform(self) -> FloatArray:
+        if self.repeat_factor == 1:
+            return self.base
+        return np.broadcast_to(self.base[:, None], (self.base.size, self.repeat_factor)).reshape(-1)
 
     def spectrum(self) -> Tuple[FloatArray, FloatArray]:
-        """Return (frequency axis, magnitude) for the waveform."""
-        if len(self.waveform) == 0:
-            return np.array([0.0]), np.array([0.0])
+        """Return (frequency axis, magnitude) for the waveform, computed once per snapshot."""
+        if self._freqs is None or self._mags is None:
+            waveform = self.waveform
+            n = len(waveform)
+            if n == 0:
+                freqs, mags = np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32)
+            else:
+                freqs = _fft.rfftfreq(n, d=1.0 / self.sample_rate)
+                mags = np.abs(_fft.rfft(waveform, **_FFT_KWARGS)) / n
+            freqs.setflags(write=False)
+            mags.setflags(write=False)
+            self._freqs, self._mags = freqs, mags
+        return self._freqs, self._mags
 
-        n = len(self.waveform)
-        freqs = np.fft.rfftfreq(n, d=1.0 / self.sample_rate)
-        mags = np.abs(np.fft.rfft(self.waveform)) / max(n, 1)
-        return freqs, mags
+
+@dataclass
+class SimulationBuffers:
+    """All stage taps of one simulation; the three carrier-rate stages share one allocation."""
+
+    sample_rate: float
+    source: FloatArray
+    spreader: FloatArray
+    modulator: FloatArray
+    channel: FloatArray
+    correlator: FloatArray
+    decoder: FloatArray
+    repeat_factors: Dict[StageName, int]
+    _snapshots: Dict[StageName, StageSnapshot] = field(default_factory=dict, repr=False)
+
+    def stage(self, name: StageName) -> StageSnapshot:
+        """Return the snapshot for ``name``; built on first access so its spectrum cache persists."""
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            snapshot = StageSnapshot(getattr(self, name.value), self.sample_rate, self.repeat_factors.get(name, 1))
+            self._snapshots[name] = snapshot
+        return snapshot
 
 
 @dataclass
@@ -38,7 +105,11 @@ class SimulationResult:
     simulation_id: str
     decoded_message: str
     mismatch: bool
-    stages: Dict[StageName, StageSnapshot]
+    buffers: SimulationBuffers
+
+    @property
+    def stages(self) -> Dict[StageName, StageSnapshot]:
+        return {name: self.buffers.stage(name) for name in StageName}
 
 
 def _text_to_bits(data: bytes) -> NDArray[np.uint8]:
@@ -53,74 +124,180 @@ def _bits_to_text(bits: NDArray[np.uint8], expected_bytes: int) -> str:
         return ""
     trimmed = bits[: expected_bytes * 8]
     padded = np.pad(trimmed, (0, (-trimmed.size) % 8), constant_values=0)
-    packed = np.packbits(padded)[:expected_bytes]
-    return packed.tobytes().decode("utf-8", errors="replace")
+    return _packed_bits_to_text(np.packbits(padded), expected_bytes)
+
+
+def _packed_bits_to_text(packed: NDArray[np.uint8], expected_bytes: int) -> str:
+    return packed[:expected_bytes].tobytes().decode("utf-8", errors="replace")
 
 
 def _nrz(bits: NDArray[np.uint8]) -> FloatArray:
-    return 2.0 * bits.astype(np.float64) - 1.0
+    return 2.0 * bits.astype(np.float32, copy=False) - 1.0
 
 
+@functools.lru_cache(maxsize=128)
 def _generate_seed(secret: str) -> int:
-    digest = hashlib.sha256(secret.encode("utf-8")).digest()
-    return int.from_bytes(digest[:8], "big", signed=False)
+    digest = hashlib.blake2b(secret.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=False)
 
 
+@functools.lru_cache(maxsize=128)
 def _generate_prn(secret: str, chips_per_bit: int) -> FloatArray:
+    """Return the PRN chips for ``secret``; cached, so the array is read-only."""
     rng = np.random.default_rng(_generate_seed(secret))
-    chips = rng.choice([-1.0, 1.0], size=chips_per_bit, replace=True)
-    return chips.astype(np.float64)
+    chips = rng.choice([-1.0, 1.0], size=chips_per_bit, replace=True).astype(np.float32)
+    chips.setflags(write=False)
+    return chips
+
 
+_CARRIER_CACHE_SIZE = 4
+_carriers: MutableMapping[Tuple[float, float], FloatArray] = OrderedDict()
 
-def _repeat(sequence: FloatArray, repeat_factor: int) -> FloatArray:
-    return np.repeat(sequence, repeat_factor)
 
+def _make_carrier(carrier_freq: float, sample_rate: float, n: int) -> FloatArray:
+    """Return ``n`` carrier samples as a read-only prefix of a cached, growing buffer.
 
-def _awgn(signal: FloatArray, noise_power: float) -> FloatArray:
+    Sample ``k`` does not depend on ``n``, so one buffer per (carrier_freq, sample_rate)
+    serves every message length.
+    """
+    key = (carrier_freq, sample_rate)
+    carrier = _carriers.pop(key, None)
+    if carrier is None or carrier.size < n:
+        size = max(n, 2 * carrier.size) if carrier is not None else n
+        # Phase is evaluated in double precision; float32 time stamps drift on long messages.
+        time = np.arange(size, dtype=np.float64) / sample_rate
+        carrier = np.cos(2.0 * np.pi * carrier_freq * time).astype(np.float32)
+        carrier.setflags(write=False)
+    _carriers[key] = carrier
+    if len(_carriers) > _CARRIER_CACHE_SIZE:
+        _carriers.popitem(last=False)  # type: ignore[call-arg]
+    return carrier[:n]
+
+
+def _awgn(signal: FloatArray, noise_power: float, rng: np.random.Generator) -> FloatArray:
     if noise_power <= 0:
         return signal
-    rng = np.random.default_rng()
-    noise = rng.normal(0.0, math.sqrt(noise_power), size=signal.shape)
+    noise = rng.standard_normal(size=signal.shape, dtype=np.float32) * math.sqrt(noise_power)
     return signal + noise
 
 
-def _band_limited_awgn(signal: FloatArray, noise_power: float, bandwidth: float, sample_rate: float) -> FloatArray:
-    if noise_power <= 0 or bandwidth <= 0:
-        return signal
+def _bandlimit_fir_length(bandwidth: float, sample_rate: float) -> int:
+    """Odd tap count whose transition band fits inside a quarter of ``bandwidth``."""
+    numtaps = math.ceil(NOISE_FIR_TAPS_PER_RATIO * sample_rate / bandwidth)
+    return numtaps | 1
 
-    rng = np.random.default_rng()
-    raw_noise = rng.normal(0.0, 1.0, size=signal.shape)
 
-    n = signal.size
-    freqs = np.fft.rfftfreq(n, d=1.0 / sample_rate)
-    spectrum = np.fft.rfft(raw_noise)
-    half_bw = min(bandwidth / 2.0, sample_rate / 2)
-    mask = (freqs >= -half_bw) & (freqs <= half_bw)
-    if not np.any(mask):
-        return signal
-    spectrum[~mask] = 0
-    shaped_noise = np.fft.irfft(spectrum, n=n)
+@functools.lru_cache(maxsize=32)
+def _design_bandlimit_fir(bandwidth: float, sample_rate: float, numtaps: int) -> FloatArray:
+    """Windowed-sinc low-pass passing ``[-bandwidth/2, bandwidth/2]``; cached, so read-only."""
+    cutoff = min(bandwidth / 2.0, sample_rate / 2.0) / sample_rate
+    offsets = np.arange(numtaps, dtype=np.float64) - (numtaps - 1) / 2.0
+    taps = 2.0 * cutoff * np.sinc(2.0 * cutoff * offsets) * np.hamming(numtaps)
+    taps = (taps / taps.sum()).astype(np.float32)
+    taps.setflags(write=False)
+    return taps
+
+
+def _band_limited_noise(
+    out: FloatArray,
+    noise_power: float,
+    bandwidth: float,
+    sample_rate: float,
+    rng: np.random.Generator,
+) -> None:
+    """Fill ``out`` with noise of ``noise_power`` confined to ``[-bandwidth/2, bandwidth/2]``.
+
+    Wide bands are shaped with a short FIR; bands too narrow for ``MAX_NOISE_FIR_TAPS`` to
+    resolve fall back to masking the noise spectrum.
+    """
+    if noise_power <= 0 or bandwidth <= 0:
+        out.fill(0.0)
+        return
+
+    raw_noise = rng.standard_normal(size=out.shape, dtype=np.float32)
+
+    numtaps = _bandlimit_fir_length(bandwidth, sample_rate)
+    if bandwidth >= sample_rate:
+        shaped_noise = raw_noise
+    elif numtaps <= MAX_NOISE_FIR_TAPS:
+        taps = _design_bandlimit_fir(bandwidth, sample_rate, numtaps)
+        start = (taps.size - 1) // 2
+        shaped_noise = np.convolve(raw_noise, taps)[start : start + out.size]
+    else:
+        spectrum = _fft.rfft(raw_noise, **_FFT_KWARGS)
+        freqs = _fft.rfftfreq(out.size, d=1.0 / sample_rate)
+        spectrum[freqs > bandwidth / 2.0] = 0
+        shaped_noise = _fft.irfft(spectrum, n=out.size, **_FFT_KWARGS)
     std = np.std(shaped_noise)
     if std > 0:
-        shaped_noise = shaped_noise / std * math.sqrt(noise_power)
+        np.multiply(shaped_noise, math.sqrt(noise_power) / std, out=out)
     else:
-        shaped_noise = np.zeros_like(signal)
-    return signal + shaped_noise
+        out.fill(0.0)
+
+
+# Line-coding kernels: NumPy expressions, replaced by numba-compiled loops when available.
+def _manchester_encode_numpy(bits: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    encoded = np.empty(bits.size * 2, dtype=np.uint8)
+    encoded[0::2] = bits
+    encoded[1::2] = bits ^ 1
+    return encoded
+
+
+def _manchester_decode_numpy(bits: NDArray[np.uint8], payload_len: int) -> NDArray[np.uint8]:
+    trimmed = bits[: (bits.size // 2) * 2].reshape(-1, 2)
+    decoded = (trimmed[:, 0] > trimmed[:, 1]).astype(np.uint8)
+    return decoded[:payload_len]
+
+
+def _rep3_decode_numpy(bits: NDArray[np.uint8], payload_len: int) -> NDArray[np.uint8]:
+    votes = bits[: (bits.size // 3) * 3].reshape(-1, 3)
+    a, b, c = votes[:, 0], votes[:, 1], votes[:, 2]
+    return ((a & b) | (a & c) | (b & c))[:payload_len]
 
 
-def _chunk_mean(values: FloatArray, chunk_size: int) -> FloatArray:
-    if chunk_size <= 0:
-        raise ValueError("chunk_size must be > 0")
-    trimmed = values[: (len(values) // chunk_size) * chunk_size]
-    return trimmed.reshape(-1, chunk_size).mean(axis=1)
+if njit is not None:
+
+    @njit(cache=True)
+    def _manchester_encode_jit(bits: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        encoded = np.empty(bits.size * 2, dtype=np.uint8)
+        for i in range(bits.size):
+            encoded[2 * i] = bits[i]
+            encoded[2 * i + 1] = bits[i] ^ 1
+        return encoded
+
+    @njit(cache=True)
+    def _manchester_decode_jit(bits: NDArray[np.uint8], payload_len: int) -> NDArray[np.uint8]:
+        n = min(bits.size // 2, payload_len)
+        decoded = np.empty(n, dtype=np.uint8)
+        for i in range(n):
+            decoded[i] = 1 if bits[2 * i] > bits[2 * i + 1] else 0
+        return decoded
+
+    @njit(cache=True)
+    def _rep3_decode_jit(bits: NDArray[np.uint8], payload_len: int) -> NDArray[np.uint8]:
+        n = min(bits.size // 3, payload_len)
+        decoded = np.empty(n, dtype=np.uint8)
+        for i in range(n):
+            a, b, c = bits[3 * i], bits[3 * i + 1], bits[3 * i + 2]
+            decoded[i] = (a & b) | (a & c) | (b & c)
+        return decoded
+
+    _manchester_encode = _manchester_encode_jit
+    _manchester_decode = _manchester_decode_jit
+    _rep3_decode = _rep3_decode_jit
+else:  # pragma: no cover - optional dependency
+    _manchester_encode = _manchester_encode_numpy
+    _manchester_decode = _manchester_decode_numpy
+    _rep3_decode = _rep3_decode_numpy
 
 
 class DSSSEngine:
     """Numerical DSSS simulator with lightweight caching for spectra taps."""
 
     def __init__(self, cache_size: int = 16) -> None:
-        self._cache: MutableMapping[str, Dict[StageName, StageSnapshot]] = OrderedDict()
+        self._cache: MutableMapping[str, SimulationBuffers] = OrderedDict()
         self._cache_size = cache_size
+        self._rng = np.random.default_rng()
 
     # Public API -----------------------------------------------------------------
     def simulate(
@@ -145,46 +322,54 @@ class DSSSEngine:
 
         tx_prn = _generate_prn(tx_secret, chips_per_bit)
         spread_chips = self._spread_bits(encoded_bits, tx_prn, chips_per_bit)
-        chip_waveform = _repeat(spread_chips, oversampling)
-        source_waveform = self._build_source_waveform(encoded_bits, chips_per_bit * oversampling)
-
-        time = np.arange(chip_waveform.size, dtype=np.float64) / sample_rate
-        carrier = np.cos(2.0 * np.pi * carrier_freq * time)
-        tx_signal = chip_waveform * carrier
-        channel_output = _band_limited_awgn(tx_signal, noise_power, noise_bandwidth, sample_rate)
+        source_symbols = self._build_source_symbols(encoded_bits)
 
-        # Receiver side ----------------------------------------------------------
-        rx_demod = channel_output * carrier
-        rx_chips = _chunk_mean(rx_demod, oversampling)
+        # Modulator, channel and correlator taps are written into one backing buffer.
+        n_samples = spread_chips.size * oversampling
+        backing = np.empty((3, n_samples), dtype=np.float32)
+        carrier = _make_carrier(carrier_freq, sample_rate, n_samples)
+        # Noise is normalised over the whole burst, so it is drawn up front into the channel row.
+        _band_limited_noise(backing[1], noise_power, noise_bandwidth, sample_rate, self._rng)
 
         rx_prn = _generate_prn(rx_secret, chips_per_bit)
-        despread = rx_chips * np.tile(rx_prn, len(encoded_bits) or 1)
-        bit_metrics = _chunk_mean(despread, chips_per_bit)
-        recovered_bits = (bit_metrics > 0).astype(np.uint8)
-
-        decoded_bits = self._decode_bits(recovered_bits, coding_scheme, coding_meta)
-        decoded = _bits_to_text(decoded_bits, expected_bytes)
+        samples_per_bit = chips_per_bit * oversampling
+        bit_metrics = self._transceive(spread_chips, carrier, rx_prn, oversampling, backing)
+        decisions = bit_metrics > 0
+
+        if coding_scheme == CodingScheme.NRZ:
+            # NRZ decisions are the payload bits, so pack them straight into bytes.
+            packed = np.packbits(decisions)
+            decoded = _packed_bits_to_text(packed, expected_bytes)
+            decoder_symbols = decisions[: payload_bits.size or decisions.size]
+        else:
+            recovered_bits = decisions.astype(np.uint8)
+            decoded_bits = self._decode_bits(recovered_bits, coding_scheme, coding_meta)
+            decoded = _bits_to_text(decoded_bits, expected_bytes)
+            decoder_symbols = decoded_bits if decoded_bits.size else recovered_bits
         mismatch = decoded != message
 
-        decoder_symbols = decoded_bits if decoded_bits.size else recovered_bits
-        decoder_waveform = _repeat(_nrz(decoder_symbols), chips_per_bit * oversampling)
-
-        stages = {
-            StageName.SOURCE: StageSnapshot(source_waveform, sample_rate),
-            StageName.SPREADER: StageSnapshot(chip_waveform, sample_rate),
-            StageName.MODULATOR: StageSnapshot(tx_signal, sample_rate),
-            StageName.CHANNEL: StageSnapshot(channel_output, sample_rate),
-            StageName.CORRELATOR: StageSnapshot(rx_demod, sample_rate),
-            StageName.DECODER: StageSnapshot(decoder_waveform, sample_rate),
-        }
+        buffers = SimulationBuffers(
+            sample_rate=sample_rate,
+            source=source_symbols,
+            spreader=spread_chips,
+            modulator=backing[0],
+            channel=backing[1],
+            correlator=backing[2],
+            decoder=_nrz(decoder_symbols),
+            repeat_factors={
+                StageName.SOURCE: samples_per_bit,
+                StageName.SPREADER: oversampling,
+                StageName.DECODER: samples_per_bit,
+            },
+        )
 
         sim_id = uuid.uuid4().hex
-        self._store(sim_id, stages)
-        return SimulationResult(simulation_id=sim_id, decoded_message=decoded, mismatch=mismatch, stages=stages)
+        self._store(sim_id, buffers)
+        return SimulationResult(simulation_id=sim_id, decoded_message=decoded, mismatch=mismatch, buffers=buffers)
 
     def get_stage(self, simulation_id: str, stage: StageName) -> StageSnapshot:
         try:
-            return self._cache[simulation_id][stage]
+            return self._cache[simulation_id].stage(stage)
         except KeyError as exc:  # pragma: no cover - guard clause
             raise KeyError(f"Unknown simulation_id/stage combination: {simulation_id}/{stage}") from exc
 
@@ -192,23 +377,58 @@ class DSSSEngine:
     @staticmethod
     def _spread_bits(bits: NDArray[np.uint8], prn: FloatArray, chips_per_bit: int) -> FloatArray:
         if bits.size == 0:
-            return np.zeros(chips_per_bit, dtype=np.float64)
+            return np.zeros(chips_per_bit, dtype=np.float32)
         bit_symbols = _nrz(bits)
-        expanded_bits = np.repeat(bit_symbols, chips_per_bit)
-        tiled_prn = np.tile(prn, bits.size)
-        return expanded_bits * tiled_prn
+        return np.multiply.outer(bit_symbols, prn).ravel()
 
     @staticmethod
-    def _build_source_waveform(bits: NDArray[np.uint8], repeats: int) -> FloatArray:
+    def _transceive(
+        spread_chips: FloatArray,
+        carrier: FloatArray,
+        rx_prn: FloatArray,
+        oversampling: int,
+        backing: FloatArray,
+    ) -> FloatArray:
+        """Modulate, add channel noise, demodulate and despread, tile by tile.
+
+        ``backing`` rows are the modulator, channel and correlator taps; the channel row must
+        already hold the noise. Each tile runs the whole chain while its samples are still in
+        cache, and the per-bit metrics are returned.
+        """
+        tx_signal, channel_output, rx_demod = backing
+        samples_per_bit = rx_prn.size * oversampling
+        # Chip averaging and despreading fused into a single matrix-vector product; the
+        # 1 / samples_per_bit averaging scale is folded into the reference vector.
+        rx_reference = np.repeat(rx_prn / samples_per_bit, oversampling)
+        n_bits = carrier.size // samples_per_bit
+        bit_metrics = np.empty(n_bits, dtype=np.float32)
+        tile_bits = max(1, PIPELINE_TILE_SAMPLES // samples_per_bit)
+        for first in range(0, n_bits, tile_bits):
+            last = min(first + tile_bits, n_bits)
+            lo, hi = first * samples_per_bit, last * samples_per_bit
+            carrier_tile = carrier[lo:hi]
+            tx_tile, channel_tile, rx_tile = tx_signal[lo:hi], channel_output[lo:hi], rx_demod[lo:hi]
+            # Each chip is held for ``oversampling`` samples; broadcast instead of materialising it.
+            np.multiply(
+                spread_chips[lo // oversampling : hi // oversampling, None],
+                carrier_tile.reshape(-1, oversampling),
+                out=tx_tile.reshape(-1, oversampling),
+            )
+            np.add(tx_tile, channel_tile, out=channel_tile)
+            np.multiply(channel_tile, carrier_tile, out=rx_tile)
+            np.matmul(rx_tile.reshape(-1, samples_per_bit), rx_reference, out=bit_metrics[first:last])
+        return bit_metrics
+
+    @staticmethod
+    def _build_source_symbols(bits: NDArray[np.uint8]) -> FloatArray:
         if bits.size == 0:
-            return np.zeros(repeats or 1, dtype=np.float64)
-        symbols = _nrz(bits)
-        return np.repeat(symbols, repeats)
+            return np.zeros(1, dtype=np.float32)
+        return _nrz(bits)
 
-    def _store(self, simulation_id: str, stages: Dict[StageName, StageSnapshot]) -> None:
+    def _store(self, simulation_id: str, buffers: SimulationBuffers) -> None:
         if simulation_id in self._cache:
             del self._cache[simulation_id]
-        self._cache[simulation_id] = stages
+        self._cache[simulation_id] = buffers
         if len(self._cache) > self._cache_size:
             self._cache.popitem(last=False)
 
@@ -220,11 +440,7 @@ class DSSSEngine:
         if scheme == CodingScheme.NRZ:
             return bits.copy(), meta
         if scheme == CodingScheme.MANCHESTER:
-            encoded = np.empty(bits.size * 2, dtype=np.uint8)
-            mask = bits.astype(bool)
-            encoded[0::2] = np.where(mask, 1, 0)
-            encoded[1::2] = np.where(mask, 0, 1)
-            return encoded, meta
+            return _manchester_encode(bits), meta
         if scheme == CodingScheme.REP3:
             meta["repeat"] = 3
             return np.repeat(bits, 3), meta
@@ -235,10 +451,14 @@ class DSSSEngine:
             meta["padding"] = padding
             reshaped = bits.reshape(-1, 4)
             d1, d2, d3, d4 = reshaped.T
-            p1 = (d1 ^ d2 ^ d4).astype(np.uint8)
-            p2 = (d1 ^ d3 ^ d4).astype(np.uint8)
-            p3 = (d2 ^ d3 ^ d4).astype(np.uint8)
-            codewords = np.stack((p1, p2, d1, p3, d2, d3, d4), axis=1)
+            codewords = np.empty((reshaped.shape[0], 7), dtype=np.uint8)
+            codewords[:, 0] = d1 ^ d2 ^ d4
+            codewords[:, 1] = d1 ^ d3 ^ d4
+            codewords[:, 2] = d1
+            codewords[:, 3] = d2 ^ d3 ^ d4
+            codewords[:, 4] = d2
+            codewords[:, 5] = d3
+            codewords[:, 6] = d4
             return codewords.reshape(-1), meta
         raise ValueError(f"Unsupported coding scheme: {scheme}")
 
@@ -252,11 +472,11 @@ class DSSSEngine:
         if scheme == CodingScheme.NRZ:
             return bits[:payload_len]
         if scheme == CodingScheme.MANCHESTER:
-            trimmed = bits[: (bits.size // 2) * 2].reshape(-1, 2)
-            decoded = (trimmed[:, 0] > trimmed[:, 1]).astype(np.uint8)
-            return decoded[:payload_len]
+            return _manchester_decode(bits, payload_len)
         if scheme == CodingScheme.REP3:
             repeat = meta.get("repeat", 3)
+            if repeat == 3:
+                return _rep3_decode(bits, payload_len)
             trimmed = bits[: (bits.size // repeat) * repeat]
             if trimmed.size == 0:
                 return trimmed
@@ -273,11 +493,8 @@ class DSSSEngine:
             s2 = c2 ^ c3 ^ c6 ^ c7
             s3 = c4 ^ c5 ^ c6 ^ c7
             syndrome = s1 + (s2 << 1) + (s3 << 2)
-            for idx, syn in enumerate(syndrome):
-                if syn == 0:
-                    continue
-                pos = syn - 1
-                blocks[idx, pos] ^= 1
+            errored = np.nonzero(syndrome)[0]
+            blocks[errored, syndrome[errored] - 1] ^= 1
             data = blocks[:, [2, 4, 5, 6]].reshape(-1)
             padding = meta.get("padding", 0)
             if padding:
@@ -1,14 +1,18 @@
 """API routers for the DSSS simulator."""
 from __future__ import annotations
 
+import base64
 import math
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 import numpy as np
 from fastapi import APIRouter, HTTPException, Query, status
 
 from .dsss_engine import DSSSEngine, FloatArray, StageSnapshot
 from .schemas import (
+    BinarySpectrumSnapshot,
+    BinaryStageDetailResponse,
+    BinaryWaveformSnapshot,
     ErrorResponse,
     SimulationRequest,
     SimulationResponse,
@@ -87,11 +91,31 @@ async def stage_detail(stage: StageName, simulation_id: str = Query(..., min_len
     return StageDetailResponse(stage=stage, spectrum=spectrum, waveform=waveform)
 
 
+@router.get(
+    "/spectra_binary/{stage}",
+    response_model=BinaryStageDetailResponse,
+    responses={status.HTTP_404_NOT_FOUND: {"model": ErrorResponse}},
+    tags=["spectra"],
+)
+async def stage_detail_binary(
+    stage: StageName, simulation_id: str = Query(..., min_length=8)
+) -> BinaryStageDetailResponse:
+    try:
+        snapshot = engine.get_stage(simulation_id, stage)
+    except KeyError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Simulation or stage not found") from exc
+
+    spectrum = _to_binary_spectrum(stage, snapshot)
+    waveform = _to_binary_waveform(stage, snapshot)
+    return BinaryStageDetailResponse(stage=stage, spectrum=spectrum, waveform=waveform)
+
+
 # --------------------------------------------------------------------------- utils
 def _to_spectrum(stage: StageName, snapshot: StageSnapshot, max_points: int = 2048) -> SpectrumSnapshot:
     freqs, mags = snapshot.spectrum()
     freqs = _decimate(freqs, max_points)
-    mags = _decimate(mags, max_points)
+    # Keep the spectral envelope: a block mean would flatten narrow peaks.
+    mags = _decimate(mags, max_points, reduce=np.max)
     return SpectrumSnapshot(
         stage=stage,
         frequencies=freqs.tolist(),
@@ -101,13 +125,51 @@ def _to_spectrum(stage: StageName, snapshot: StageSnapshot, max_points: int = 20
 
 
 def _to_waveform(stage: StageName, snapshot: StageSnapshot, max_points: int = 2048) -> WaveformSnapshot:
-    samples = _decimate(snapshot.waveform, max_points)
+    samples = _envelope(snapshot.waveform, max_points)
     return WaveformSnapshot(stage=stage, samples=samples.tolist(), sample_rate=snapshot.sample_rate)
 
 
-def _decimate(values: Iterable[float], max_points: int) -> FloatArray:
-    arr = np.asarray(values, dtype=np.float64)
+def _to_binary_spectrum(stage: StageName, snapshot: StageSnapshot, max_points: int = 2048) -> BinarySpectrumSnapshot:
+    freqs, mags = snapshot.spectrum()
+    return BinarySpectrumSnapshot(
+        stage=stage,
+        frequencies_b64=_encode_float32(_decimate(freqs, max_points)),
+        magnitudes_b64=_encode_float32(_decimate(mags, max_points, reduce=np.max)),
+        sample_rate=snapshot.sample_rate,
+    )
+
+
+def _to_binary_waveform(stage: StageName, snapshot: StageSnapshot, max_points: int = 2048) -> BinaryWaveformSnapshot:
+    samples = _envelope(snapshot.waveform, max_points)
+    return BinaryWaveformSnapshot(stage=stage, samples_b64=_encode_float32(samples), sample_rate=snapshot.sample_rate)
+
+
+def _encode_float32(values: FloatArray) -> str:
+    return base64.b64encode(np.asarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+
+def _envelope(values: Iterable[float], max_points: int) -> FloatArray:
+    """Reduce ``values`` to at most ``max_points`` as interleaved per-block (min, max) pairs.
+
+    Carrier-rate stages oscillate within every block, so a block mean would flatten them.
+    """
+    arr = np.asarray(values)
+    if arr.size <= max_points:
+        return arr
+    step = math.ceil(arr.size / max(max_points // 2, 1))
+    trim = (arr.size // step) * step
+    blocks = arr[:trim].reshape(-1, step)
+    envelope = np.empty((blocks.shape[0], 2), dtype=arr.dtype)
+    blocks.min(axis=1, out=envelope[:, 0])
+    blocks.max(axis=1, out=envelope[:, 1])
+    return envelope.reshape(-1)
+
+
+def _decimate(values: Iterable[float], max_points: int, reduce: Callable[..., FloatArray] = np.mean) -> FloatArray:
+    """Reduce ``values`` to at most ``max_points`` by applying ``reduce`` over equal blocks."""
+    arr = np.asarray(values)
     if arr.size <= max_points:
         return arr
     step = math.ceil(arr.size / max_points)
-    return arr[::step]
+    trim = (arr.size // step) * step
+    return reduce(arr[:trim].reshape(-1, step), axis=1)
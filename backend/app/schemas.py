@@ -44,6 +44,27 @@ class StageDetailResponse(BaseModel):
     spectrum: SpectrumSnapshot
 
 
+class BinaryWaveformSnapshot(BaseModel):
+    stage: StageName
+    samples_b64: str = Field(..., description="Base64 of little-endian samples")
+    dtype: Literal["float32"] = "float32"
+    sample_rate: float = Field(..., gt=0)
+
+
+class BinarySpectrumSnapshot(BaseModel):
+    stage: StageName
+    frequencies_b64: str = Field(..., description="Base64 of little-endian frequency axis in Hz")
+    magnitudes_b64: str = Field(..., description="Base64 of little-endian linear magnitudes")
+    dtype: Literal["float32"] = "float32"
+    sample_rate: float = Field(..., gt=0)
+
+
+class BinaryStageDetailResponse(BaseModel):
+    stage: StageName
+    waveform: BinaryWaveformSnapshot
+    spectrum: BinarySpectrumSnapshot
+
+
 class SimulationRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=256)
     tx_secret: str = Field(..., min_length=4, max_length=64)
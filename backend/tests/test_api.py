@@ -1,6 +1,11 @@
+import base64
+
+import numpy as np
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.routes import engine
+from app.schemas import StageName
 
 client = TestClient(app)
 
@@ -45,3 +50,57 @@ def test_stage_detail_endpoint_requires_simulation():
     assert response.status_code == 200
     stage = response.json()
     assert stage["spectrum"]["frequencies"], "frequencies missing"
+
+
+def test_stage_detail_is_decimated_to_max_points():
+    payload = {
+        "message": "a longer message so every stage exceeds the point budget",
+        "tx_secret": "secret",
+        "rx_secret": "secret",
+        "chip_rate": 40000.0,
+        "carrier_freq": 400000.0,
+        "noise_power": 0.5,
+        "noise_bandwidth": 15000.0,
+        "oversampling": 8,
+        "coding_scheme": "nrz",
+    }
+    sim_data = client.post("/api/simulate", json=payload).json()
+
+    response = client.get("/api/spectra/channel", params={"simulation_id": sim_data["simulation_id"]})
+    assert response.status_code == 200
+    stage = response.json()
+    assert 0 < len(stage["waveform"]["samples"]) <= 2048
+    assert len(stage["spectrum"]["frequencies"]) == len(stage["spectrum"]["magnitudes"]) <= 2048
+
+    for name in ("modulator", "correlator", "spreader"):
+        full = engine.get_stage(sim_data["simulation_id"], StageName(name)).waveform
+        samples = client.get(f"/api/spectra/{name}", params={"simulation_id": sim_data["simulation_id"]}).json()
+        decimated = np.asarray(samples["waveform"]["samples"])
+        assert decimated.size <= 2048
+        assert np.isclose(np.abs(decimated).max(), np.abs(full).max(), rtol=1e-3)
+
+
+def test_stage_detail_binary_matches_json_endpoint():
+    payload = {
+        "message": "test",
+        "tx_secret": "secret",
+        "rx_secret": "secret",
+        "chip_rate": 40000.0,
+        "carrier_freq": 400000.0,
+        "noise_power": 0.0,
+        "noise_bandwidth": 15000.0,
+        "oversampling": 4,
+        "coding_scheme": "nrz",
+    }
+    sim_data = client.post("/api/simulate", json=payload).json()
+    params = {"simulation_id": sim_data["simulation_id"]}
+
+    legacy = client.get("/api/spectra/modulator", params=params).json()
+    response = client.get("/api/spectra_binary/modulator", params=params)
+    assert response.status_code == 200
+    binary = response.json()
+    assert binary["waveform"]["dtype"] == "float32"
+    samples = np.frombuffer(base64.b64decode(binary["waveform"]["samples_b64"]), dtype="<f4")
+    magnitudes = np.frombuffer(base64.b64decode(binary["spectrum"]["magnitudes_b64"]), dtype="<f4")
+    assert np.allclose(samples, legacy["waveform"]["samples"])
+    assert np.allclose(magnitudes, legacy["spectrum"]["magnitudes"])
@@ -1,6 +1,7 @@
 import numpy as np
+import pytest
 
-from app.dsss_engine import DSSSEngine
+from app.dsss_engine import DSSSEngine, StageSnapshot, _band_limited_noise, _generate_prn, _make_carrier
 from app.schemas import CodingScheme, StageName
 
 
@@ -30,7 +31,7 @@ def test_secret_mismatch_flags_error():
     result = engine.simulate(
         message="HELLO DSSS",
         tx_secret="alpha",
-        rx_secret="impostor-key",
+        rx_secret="bogus-key",
         chip_rate=50_000,
         carrier_freq=500_000,
         noise_power=0.0,
@@ -49,3 +50,97 @@ def test_hamming_encoder_decoder_round_trip():
     encoded, meta = engine._encode_bits(bits, CodingScheme.HAMMING74)
     recovered = engine._decode_bits(encoded, CodingScheme.HAMMING74, meta)
     assert np.array_equal(recovered, bits)
+
+
+def test_prn_is_cached_and_read_only():
+    first = _generate_prn("alpha", 32)
+    second = _generate_prn("alpha", 32)
+    assert first is second
+    assert not first.flags.writeable
+
+
+def test_hamming_decoder_corrects_single_bit_errors():
+    engine = DSSSEngine()
+    bits = np.array([1, 0, 1, 1, 0, 1, 0, 0], dtype=np.uint8)
+    encoded, meta = engine._encode_bits(bits, CodingScheme.HAMMING74)
+    corrupted = encoded.copy()
+    corrupted[[0, 12]] ^= 1
+    recovered = engine._decode_bits(corrupted, CodingScheme.HAMMING74, meta)
+    assert np.array_equal(recovered, bits)
+
+
+def test_rep3_decoder_majority_vote():
+    engine = DSSSEngine()
+    bits = np.array([1, 0, 1, 1], dtype=np.uint8)
+    encoded, meta = engine._encode_bits(bits, CodingScheme.REP3)
+    corrupted = encoded.copy()
+    corrupted[[0, 4, 8]] ^= 1
+    recovered = engine._decode_bits(corrupted, CodingScheme.REP3, meta)
+    assert recovered.dtype == np.uint8
+    assert np.array_equal(recovered, bits)
+
+
+def test_stage_spectrum_is_computed_once():
+    snapshot = StageSnapshot(np.array([1.0, -1.0], dtype=np.float32), sample_rate=8.0, repeat_factor=4)
+    freqs, mags = snapshot.spectrum()
+    assert snapshot.waveform.size == 8
+    assert freqs.size == mags.size == 5
+    assert snapshot.spectrum()[1] is mags
+
+
+@pytest.mark.parametrize(
+    ("bandwidth", "sample_rate"),
+    [
+        (200_000.0, 800_000.0),  # wide enough for the FIR path
+        (20_000.0, 800_000.0),  # UI defaults
+        (5_000.0, 3_200_000.0),  # slider minimum at 32x oversampling
+    ],
+)
+def test_band_limited_noise_stays_in_band(bandwidth, sample_rate):
+    noise = np.empty(1 << 16, dtype=np.float32)
+    _band_limited_noise(noise, 1.0, bandwidth, sample_rate, np.random.default_rng(0))
+    assert np.isclose(noise.var(), 1.0, rtol=1e-3)
+
+    power = np.abs(np.fft.rfft(noise)) ** 2
+    freqs = np.fft.rfftfreq(noise.size, d=1.0 / sample_rate)
+    out_of_band = power[freqs > 1.25 * bandwidth / 2].sum() / power.sum()
+    assert out_of_band < 0.01
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 8, 63, 1000])
+def test_numba_line_coders_match_numpy(size):
+    pytest.importorskip("numba")
+    from app import dsss_engine
+
+    bits = np.random.default_rng(size).integers(0, 2, size=size, dtype=np.uint8)
+    assert np.array_equal(dsss_engine._manchester_encode_jit(bits), dsss_engine._manchester_encode_numpy(bits))
+    for payload_len in (0, size // 3, size):
+        assert np.array_equal(
+            dsss_engine._manchester_decode_jit(bits, payload_len),
+            dsss_engine._manchester_decode_numpy(bits, payload_len),
+        )
+        assert np.array_equal(
+            dsss_engine._rep3_decode_jit(bits, payload_len),
+            dsss_engine._rep3_decode_numpy(bits, payload_len),
+        )
+
+
+def test_scipy_spectrum_matches_numpy_reference():
+    pytest.importorskip("scipy")
+    from app import dsss_engine
+
+    assert dsss_engine._fft.__name__ == "scipy.fft"
+    waveform = np.random.default_rng(0).standard_normal(1001).astype(np.float32)
+    freqs, mags = StageSnapshot(waveform, sample_rate=1000.0).spectrum()
+    assert np.allclose(freqs, np.fft.rfftfreq(waveform.size, d=1e-3))
+    assert np.allclose(mags, np.abs(np.fft.rfft(waveform.astype(np.float64))) / waveform.size, atol=1e-6)
+
+
+def test_carrier_prefix_is_shared_across_lengths():
+    long = _make_carrier(123_000.0, 1_000_000.0, 5000)
+    short = _make_carrier(123_000.0, 1_000_000.0, 1000)
+    assert np.shares_memory(long, short)
+    assert not short.flags.writeable
+    assert np.array_equal(short, long[:1000])
+    time = np.arange(1000, dtype=np.float64) / 1_000_000.0
+    assert np.allclose(short, np.cos(2.0 * np.pi * 123_000.0 * time))
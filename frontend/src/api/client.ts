@@ -1,6 +1,7 @@
 import axios from 'axios';
 import { API_BASE_URL } from '../config';
 import type {
+  BinaryStageDetailResponse,
   SimulationRequest,
   SimulationResponse,
   StageDetailResponse,
@@ -26,3 +27,35 @@ export async function fetchStageDetail(
   });
   return data;
 }
+
+function decodeFloat32(encoded: string): number[] {
+  const raw = atob(encoded);
+  const bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i += 1) {
+    bytes[i] = raw.charCodeAt(i);
+  }
+  return Array.from(new Float32Array(bytes.buffer));
+}
+
+export async function fetchStageDetailBinary(
+  simulationId: string,
+  stage: StageName,
+): Promise<StageDetailResponse> {
+  const { data } = await http.get<BinaryStageDetailResponse>(`/spectra_binary/${stage}`, {
+    params: { simulation_id: simulationId },
+  });
+  return {
+    stage: data.stage,
+    waveform: {
+      stage: data.waveform.stage,
+      samples: decodeFloat32(data.waveform.samples_b64),
+      sample_rate: data.waveform.sample_rate,
+    },
+    spectrum: {
+      stage: data.spectrum.stage,
+      frequencies: decodeFloat32(data.spectrum.frequencies_b64),
+      magnitudes: decodeFloat32(data.spectrum.magnitudes_b64),
+      sample_rate: data.spectrum.sample_rate,
+    },
+  };
+}
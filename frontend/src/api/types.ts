@@ -48,3 +48,24 @@ export interface StageDetailResponse {
   waveform: WaveformSnapshot;
   spectrum: SpectrumSnapshot;
 }
+
+export interface BinaryWaveformSnapshot {
+  stage: StageName;
+  samples_b64: string;
+  dtype: 'float32';
+  sample_rate: number;
+}
+
+export interface BinarySpectrumSnapshot {
+  stage: StageName;
+  frequencies_b64: string;
+  magnitudes_b64: string;
+  dtype: 'float32';
+  sample_rate: number;
+}
+
+export interface BinaryStageDetailResponse {
+  stage: StageName;
+  waveform: BinaryWaveformSnapshot;
+  spectrum: BinarySpectrumSnapshot;
+}
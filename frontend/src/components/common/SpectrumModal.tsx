@@ -12,24 +12,31 @@ import type { StageDetailResponse, StageName } from '../../api/types';
 const STAGE_SNIPPETS: Record<StageName, string> = {
   source: `# Источник
 bits = _text_to_bits(message_bytes)
-waveform = _build_source_waveform(bits, chips_per_bit * oversampling)`,
+source_symbols = _build_source_symbols(encoded_bits)
+# каждый символ удерживается chips_per_bit * oversampling отсчётов
+StageSnapshot(source_symbols, sample_rate, samples_per_bit)`,
   spreader: `# Расширение спектра
 tx_prn = _generate_prn(tx_secret, chips_per_bit)
-chip_waveform = _repeat(_spread_bits(bits, tx_prn, chips_per_bit), oversampling)`,
-  modulator: `# Модуляция базового сигнала
-time = np.arange(chip_waveform.size) / sample_rate
-carrier = np.cos(2 * np.pi * carrier_freq * time)
-tx_signal = chip_waveform * carrier`,
-  channel: `# Канал с шумом
-channel_output = _awgn(tx_signal, noise_power)`,
+spread_chips = np.multiply.outer(_nrz(encoded_bits), tx_prn).ravel()
+# каждый чип удерживается oversampling отсчётов
+StageSnapshot(spread_chips, sample_rate, oversampling)`,
+  modulator: `# Модуляция несущей (_transceive, по блокам)
+carrier = _make_carrier(carrier_freq, sample_rate, n_samples)
+np.multiply(spread_chips[lo // oversampling : hi // oversampling, None],
+            carrier_tile.reshape(-1, oversampling),
+            out=tx_tile.reshape(-1, oversampling))`,
+  channel: `# Канал с полосовым шумом
+_band_limited_noise(channel_output, noise_power, noise_bandwidth, sample_rate, rng)
+np.add(tx_tile, channel_tile, out=channel_tile)`,
   correlator: `# Коррелятор приёмника
-rx_demod = channel_output * carrier
-rx_chips = _chunk_mean(rx_demod, oversampling)
-despread = rx_chips * np.tile(rx_prn, len(bits) or 1)`,
+np.multiply(channel_tile, carrier_tile, out=rx_tile)
+# усреднение по чипам и свёртка с PRN — одно умножение матрицы на вектор
+rx_reference = np.repeat(rx_prn / samples_per_bit, oversampling)
+np.matmul(rx_tile.reshape(-1, samples_per_bit), rx_reference, out=bit_metrics[first:last])`,
   decoder: `# Принятие решения по битам
-bit_metrics = _chunk_mean(despread, chips_per_bit)
-recovered_bits = (bit_metrics > 0).astype(np.uint8)
-decoded = _bits_to_text(recovered_bits, expected_bytes)`,
+decisions = bit_metrics > 0
+decoded_bits = self._decode_bits(decisions.astype(np.uint8), coding_scheme, coding_meta)
+decoded = _bits_to_text(decoded_bits, expected_bytes)`,
 };
 
 interface SpectrumModalProps {
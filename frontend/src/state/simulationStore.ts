@@ -1,5 +1,5 @@
 import { create } from 'zustand';
-import { fetchStageDetail, simulate } from '../api/client';
+import { fetchStageDetailBinary, simulate } from '../api/client';
 import type {
   SimulationRequest,
   SimulationResponse,
@@ -68,7 +68,7 @@ export const useSimulationStore = create<SimulationState>((set, get) => ({
 
     set({ stageLoading: stage });
     try {
-      const detail = await fetchStageDetail(result.simulation_id, stage);
+      const detail = await fetchStageDetailBinary(result.simulation_id, stage);
       set((state) => ({
         stageDetails: { ...state.stageDetails, [stage]: detail },
         stageLoading: undefined,